@@ -69,7 +69,7 @@ class OECDatabase(object):
         """ Returns a list of transiting planet objects
         """
 
-        transitingPlanets = []
+        transitingPlanets = HomogeneousList(Planet)
 
         for planet in self.planets:
             try:
@@ -106,10 +106,10 @@ class OECDatabase(object):
         """
 
         # Initialise Database
-        self.systems = []
-        self.binaries = []
-        self.stars = []
-        self.planets = []
+        self.systems = HomogeneousList(System)
+        self.binaries = HomogeneousList(Binary)
+        self.stars = HomogeneousList(Star)
+        self.planets = HomogeneousList(Planet)
 
         if stream:
             tree = ET.parse(databaseLocation)
@@ -242,5 +242,50 @@ def load_db_from_url(url="https://github.com/OpenExoplanetCatalogue/oec_gzip/raw
     return database
 
 
+class HomogeneousList(list):
+    """ A list holding only one type of astro object, ie OECDatabase.planets. The type is stored as `_homogeneous_type`
+    so the plots can read it rather than checking every object in the list. Adding an object of any other type raises
+    a TypeError so the stored type cant go stale
+    """
+
+    def __init__(self, objectType, iterable=()):
+        self._homogeneous_type = objectType
+        list.__init__(self, self._checkTypes(iterable))
+
+    def _checkTypes(self, iterable):
+        """ returns iterable as a list, raising TypeError if any object isnt exactly `_homogeneous_type`
+        """
+        objects = list(iterable)
+        for astroObject in objects:
+            if type(astroObject) is not self._homogeneous_type:
+                raise TypeError('{0} only holds {1} objects, not {2}'.format(
+                    type(self).__name__, self._homogeneous_type, type(astroObject)))
+        return objects
+
+    def append(self, astroObject):
+        self._checkTypes((astroObject,))
+        list.append(self, astroObject)
+
+    def insert(self, index, astroObject):
+        self._checkTypes((astroObject,))
+        list.insert(self, index, astroObject)
+
+    def extend(self, iterable):
+        list.extend(self, self._checkTypes(iterable))
+
+    def __iadd__(self, iterable):
+        return list.__iadd__(self, self._checkTypes(iterable))
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = self._checkTypes(value)
+        else:
+            self._checkTypes((value,))
+        list.__setitem__(self, index, value)
+
+    def __setslice__(self, i, j, iterable):  # python 2 only, slice assignment skips __setitem__
+        list.__setslice__(self, i, j, self._checkTypes(iterable))
+
+
 class LoadDataBaseError(IOError):
     pass
\ No newline at end of file
@@ -1,31 +1,80 @@
 """ This module contains some plotting functions and plot types for easy plot creation
 """
 import os
+import re
 import sys
 import math
-from collections import OrderedDict
+import operator
+from bisect import bisect_right
+import types
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 
 import numpy as np
+import matplotlib
+
+# EXODATA_MPL_BACKEND picks the backend (i.e. Agg on CI or servers where plots are only saved), otherwise matplotlib
+# chooses as normal. See also use_fast_backend
+_backend = os.environ.get('EXODATA_MPL_BACKEND')
+if _backend is not None:
+    matplotlib.use(_backend)
+
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import colorConverter
 import time
 
 from . import astroquantities as aq
 from . import astroclasses as ac
 
+# dicts keep insertion order from python 3.7 and are lighter than OrderedDict, older versions need the real thing
+_OrderedDict = dict if sys.hexversion >= 0x03070000 else OrderedDict
 
-rcParams.update({'figure.autolayout': True})
+
+def use_fast_backend():
+    """ Switches pyplot to the non-interactive Agg backend, use this when generating many plots that are only saved
+    (i.e. saveAllBarChart in a loop). matplotlib closes any open figures when switching so call it before plotting
+    """
+    if plt.get_backend().lower() != 'agg':
+        plt.switch_backend('Agg')
 
 
 class _GlobalFigure(object):
     """ sets up the figure and subfigure object with all the global parameters.
     """
 
-    def __init__(self, size='small'):
+    def __init__(self, size='small', autolayout=True):
+        """
+        :param size: 'small' for documents or 'large' for presentations
+        :param autolayout: fit the plot to the figure with tight_layout on every draw, turn off when the layout doesnt
+            need recomputing (i.e. batch plotting) to save a layout pass per draw
+        """
+        self._batchDraw = False
+        self._autolayout = autolayout
         self.setup_fig(size)
 
     def setup_fig(self, size='small'):
-        self.set_size(size)
+        with self._batch_redraw():
+            self.set_size(size)
+
+    @contextmanager
+    def _batch_redraw(self):
+        """ suppresses the redraw in each of the setters inside the block and draws once at the end
+        """
+        if self._batchDraw:  # already batching, the outer block will draw
+            yield
+            return
+
+        self._batchDraw = True
+        try:
+            yield
+        finally:
+            self._batchDraw = False
+        self._redraw()
+
+    def _redraw(self):
+        if not self._batchDraw:
+            self.fig.canvas.draw_idle()  # this figure, plt.draw() would redraw whichever is current
 
     def set_size(self, size):
         """ choose a preset size for the plot
@@ -38,39 +87,60 @@ class _GlobalFigure(object):
         else:
             raise ValueError('Size must be large or small')
 
+    def _layout(self):
+        """ tight_layout argument for new figures. matplotlib treats any non None value (even False) as on, None leaves
+        it to rcParams
+        """
+        return True if self._autolayout else None
+
     def _set_size_small(self):
-        self.fig = plt.figure(figsize=(5, 4))
+        self.fig = plt.figure(figsize=(5, 4), tight_layout=self._layout())
         self.ax = self.fig.add_subplot(1, 1, 1)
         self.set_title_size(10)
         self.set_axis_label_size(12)
         self.set_axis_tick_label_size(12)
 
     def _set_size_large(self):
-        self.fig = plt.figure(figsize=(10, 7.5))
+        self.fig = plt.figure(figsize=(10, 7.5), tight_layout=self._layout())
         self.ax = self.fig.add_subplot(1, 1, 1)
         self.set_title_size(20)
         self.set_axis_label_size(20)
         self.set_axis_tick_label_size(20)
 
+    def _tick_labels(self, fontsize):
+        """ the current tick labels, or an empty list if they all already have fontsize so setting can be skipped. Checks
+        the labels themselves as they can change outside this class (i.e. ax.tick_params or ax.cla())
+        """
+        labels = self.ax.get_xticklabels() + self.ax.get_yticklabels()
+        if all(label.get_fontsize() == fontsize for label in labels):
+            return []
+        return labels
+
     def set_global_font_size(self, fontsize):
         ax = self.ax
-        for item in ([ax.title, ax.xaxis.label, ax.yaxis.label] + ax.get_xticklabels() + ax.get_yticklabels()):
+        items = [ax.title, ax.xaxis.label, ax.yaxis.label] + self._tick_labels(fontsize)
+
+        for item in items:
             item.set_fontsize(fontsize)
-        plt.draw()
+        self._redraw()
 
     def set_title_size(self, fontsize):
         self.ax.title.set_fontsize(fontsize)
-        plt.draw()
+        self._redraw()
 
     def set_axis_label_size(self, fontsize):
         for axis in (self.ax.xaxis.label, self.ax.yaxis.label):
             axis.set_fontsize(fontsize)
-        plt.draw()
+        self._redraw()
 
     def set_axis_tick_label_size(self, fontsize):
-        for axis in self.ax.get_xticklabels() + self.ax.get_yticklabels():
+        labels = self._tick_labels(fontsize)
+        if not labels:  # new ticks copy their font from the existing ones
+            return
+
+        for axis in labels:
             axis.set_fontsize(fontsize)
-        plt.draw()
+        self._redraw()
 
     # set_foregroundcolor / set_backgroundcolor from Jasonmc https://gist.github.com/jasonmc/1160951
     def set_foregroundcolor(self, color):
@@ -80,31 +150,31 @@ class _GlobalFigure(object):
 
          ax = self.ax
 
-         for tl in ax.get_xticklines() + ax.get_yticklines():
-             tl.set_color(color)
-         for spine in ax.spines:
-             ax.spines[spine].set_edgecolor(color)
-         for tick in ax.xaxis.get_major_ticks():
-             tick.label1.set_color(color)
-         for tick in ax.yaxis.get_major_ticks():
-             tick.label1.set_color(color)
-         ax.axes.xaxis.label.set_color(color)
-         ax.axes.yaxis.label.set_color(color)
-         ax.axes.xaxis.get_offset_text().set_color(color)
-         ax.axes.yaxis.get_offset_text().set_color(color)
-         ax.axes.title.set_color(color)
+         ticklines = ax.get_xticklines() + ax.get_yticklines()
+         spines = list(ax.spines.values())
+
+         # tick labels (label1 of the major ticks), axis labels and title all take the same text colour
+         texts = ax.get_xticklabels() + ax.get_yticklabels()
+         texts += [ax.xaxis.label, ax.yaxis.label, ax.xaxis.get_offset_text(), ax.yaxis.get_offset_text(), ax.title]
+
          lh = ax.get_legend()
          if lh != None:
-             lh.get_title().set_color(color)
+             texts += [lh.get_title()] + lh.get_texts()
+
+         # skip if everything already has the colour, checked on the artists as the axes can change outside this class
+         rgba = colorConverter.to_rgba(color)
+         if (all(colorConverter.to_rgba(artist.get_color()) == rgba for artist in ticklines + texts)
+                 and all(colorConverter.to_rgba(spine.get_edgecolor()) == rgba for spine in spines)
+                 and (lh is None or lh.legendPatch.get_edgecolor()[3] == 0)):
+             return
+
+         plt.setp(ticklines, color=color)
+         plt.setp(spines, edgecolor=color)
+         if lh != None:
              lh.legendPatch.set_edgecolor('none')
-             labels = lh.get_texts()
-             for lab in labels:
-                 lab.set_color(color)
-         for tl in ax.get_xticklabels():
-             tl.set_color(color)
-         for tl in ax.get_yticklabels():
-             tl.set_color(color)
-         plt.draw()
+
+         plt.setp(texts, color=color)
+         self._redraw()
 
     def set_backgroundcolor(self, color):
          '''Sets the background color of the current axes (and legend).
@@ -118,7 +188,7 @@ class _GlobalFigure(object):
          if lh != None:
              lh.legendPatch.set_facecolor(color)
 
-         plt.draw()
+         self._redraw()
 
     def set_y_axis_log(self, logscale=True):
         if logscale:
@@ -137,40 +207,102 @@ class _AstroObjectFigs(_GlobalFigure):
     """ contains extra functions for dealing with input of astro objects
     """
 
-    def __init__(self, objectList, size='small'):
-        _GlobalFigure.__init__(self, size)
+    def __init__(self, objectList, size='small', autolayout=True, object_type=None):
+        """
+        :param objectList: list of astro objects ie planets, stars etc
+        :param object_type: the class of every object in objectList, when given (or objectList is a HomogeneousList
+            from OECDatabase) the list isnt checked for mixed types
+        """
+        _GlobalFigure.__init__(self, size, autolayout)
         self.objectList = objectList  # list of planets, stars etc
-        self._objectType = self._getInputObjectTypes()  # are we dealing with planets, stars etc
+
+        if object_type is None:
+            object_type = getattr(objectList, '_homogeneous_type', None)
+
+        if object_type is None:
+            self._objectType = self._getInputObjectTypes()  # are we dealing with planets, stars etc
+        else:
+            self._objectType = object_type
+        self._parCache = {}  # param -> (label, unit), filled by _getParLabelAndUnit
 
     def _getInputObjectTypes(self):
         # get the type of the first object
-        firstObject = self.objectList[0]
-        firstObjectType = type(firstObject)
+        firstObjectType = type(self.objectList[0])
+
+        if not all(type(astroObject) is firstObjectType for astroObject in self.objectList):
+            otherType = next(type(astroObject) for astroObject in self.objectList
+                             if type(astroObject) is not firstObjectType)
+            raise TypeError('Input object list contains mixed types ({0} and {1})'.format(firstObjectType, otherType))
 
-        for astroObject in self.objectList:
-            if not firstObjectType == type(astroObject):
-                raise TypeError('Input object list contains mixed types ({0} and {1})'.format(firstObjectType,
-                                                                                              type(astroObject)))
         return firstObjectType
 
     def _getParLabelAndUnit(self, param):
         """ checks param to see if it contains a parent link (ie star.) then returns the correct unit and label for the
-         job from the parDicts
+         job from the parDicts. Results are cached per figure as the same param is looked up by several methods
         :return:
         """
 
+        try:
+            return self._parCache[param]
+        except KeyError:
+            pass
+
         firstObject = self.objectList[0]
 
         if isinstance(firstObject, ac.Planet):
-            if 'star.' in param:
-                return _starPars[param[5:]]  # cut off star. part
+            if param.startswith('star.'):
+                parValues = _starPars[param[5:]]  # cut off star. part
             else:
-                return _planetPars[param]
+                parValues = _planetPars[param]
         elif isinstance(firstObject, ac.Star):
-            return _starPars[param]
+            parValues = _starPars[param]
         else:
             raise TypeError('Only Planets and Star object are currently supported, you gave {0}'.format(type(firstObject)))
 
+        self._parCache[param] = parValues
+        return parValues
+
+    def _evaluateParameter(self, accessor, unit):
+        """ evaluates the accessor on every object in objectList and returns the values as an array. The values are
+        gathered as magnitudes and rescaled to `unit` in a single call rather than once per object.
+
+        :param accessor: function that takes an astro object and returns the value (see _resolve_accessor)
+        :param unit: the unit to scale the values to, None will leave them in the units of the first value
+        :return: array of the values, as a quantity if the values have units
+        """
+        values = []
+        for astroObject in self.objectList:
+            try:
+                values.append(accessor(astroObject))
+            except ac.HierarchyError:  # ie trying to call planet.star and one planet is a lone ranger
+                values.append(np.nan)
+
+        # the units of the first quantity are used for the whole array, nan and unitless values have no rescale
+        sourceUnits = None
+        for value in values:
+            if hasattr(value, 'rescale'):
+                sourceUnits = value.units
+                break
+
+        def magnitude(value):
+            if sourceUnits is not None and hasattr(value, 'rescale'):
+                if value.dimensionality != sourceUnits.dimensionality:
+                    value = value.rescale(sourceUnits)
+                return float(value.magnitude)
+            return float(value)
+
+        paramValues = np.fromiter((magnitude(value) for value in values), dtype=np.float64, count=len(values))
+
+        if sourceUnits is None:  # either all nan or unitless
+            return paramValues
+
+        paramValues = aq.Quantity(paramValues, sourceUnits)
+
+        if unit is not None:  # no unit to rescale (a aq.unitless quanitity would otherwise fail with ValueError)
+            paramValues = paramValues.rescale(unit)
+
+        return paramValues
+
     # OECPy specific functions
     def _gen_label(self, param, unit):
         # TODO could be star or other in future
@@ -199,8 +331,8 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
     * _getSortKey (take the planet, turn it into a key)
     """
 
-    def __init__(self, astroObjectList, unit=None, size='small'):  # added unit here as class will break without it anyway
-        _AstroObjectFigs.__init__(self, astroObjectList, size)
+    def __init__(self, astroObjectList, unit=None, size='small', autolayout=True, object_type=None):  # added unit here as class will break without it anyway
+        _AstroObjectFigs.__init__(self, astroObjectList, size, autolayout, object_type)
 
         self._classVariables()  # add info from child classes
         self.unit = unit
@@ -235,19 +367,24 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
         :return:
         """
 
+        counts = Counter(self._getSortKey(astroObject) for astroObject in self.objectList)
+
         resultsByClass = self._genEmptyResults()
 
-        for astroObject in self.objectList:
-            sortKey = self._getSortKey(astroObject)
-            resultsByClass[sortKey] += 1
+        for sortKey in counts:
+            if sortKey not in resultsByClass:
+                raise KeyError(sortKey)
+
+        for key in resultsByClass:
+            resultsByClass[key] = counts[key]
 
         return resultsByClass
 
     def _getPlotData(self):
         """ Turns the resultsByClass Dict into a list of bin groups skipping the uncertain group if empty
 
-        return: (label list, ydata list)
-        :rtype: tuple(list(str), list(float))
+        return: (label list, ydata array)
+        :rtype: tuple(list(str), numpy.ndarray)
         """
         resultsByClass = self.resultsByClass
 
@@ -257,19 +394,19 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
         except KeyError:
             pass
 
-        plotData = list(zip(*resultsByClass.items()))  # (labels, ydata)
+        labels = list(resultsByClass.keys())
+        ydata = np.fromiter(resultsByClass.values(), dtype=np.int64, count=len(resultsByClass))
 
-        return plotData
+        return labels, ydata
 
     def plotBarChart(self, title='', xlabel=None, c='#3ea0e4', label_rotation=False):
         ax = self.ax
 
         labels, ydata = self._getPlotData()
 
-        numItems = float(len(ydata))
+        numItems = len(ydata)
 
-        ind = np.arange(numItems)  # the x locations for the groups
-        ind /= numItems  # between 0 and 1
+        ind = np.arange(numItems, dtype=np.float64) / numItems  # the x locations for the groups between 0 and 1
 
         spacePerBar = 1./numItems
         gapratio = 0.5  # gap to bar ratio, 0.5 is even
@@ -296,7 +433,7 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
             plt.xticks(rotation=label_rotation)
         plt.ylabel('Number of Planets')  # TODO could be stars, binaries etc
         plt.title(title)
-        plt.xlim([min(ind)-gap, max(ind)+(gap*2)])
+        plt.xlim([ind[0]-gap, ind[-1]+(gap*2)])
         plt.draw()
 
     def plotPieChart(self, title=None, cmap_name='Pastel2'):
@@ -305,8 +442,7 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
 
         # Generate plot data
         labels, ydata = self._getPlotData()
-        totalobjects = float(np.sum(ydata))
-        fracs = [ynum / totalobjects for ynum in ydata]
+        fracs = ydata / float(ydata.sum())
 
         explode = np.zeros(len(fracs))  # non zero makes the slices come out of the pie
 
@@ -332,7 +468,28 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
 
     def saveAllBarChart(self, filepath, *args, **kwargs):
         self.plotBarChart(*args, **kwargs)
-        plt.savefig(os.path.join(filepath))
+        self.fig.savefig(filepath)  # renders this figure directly, not the current pyplot figure
+
+    def saveAllBarChartFast(self, filepath, *args, **kwargs):
+        """ As saveAllBarChart but writes the PNG straight from the Agg pixel buffer at a low compression level, for
+        when many charts are being saved. Falls back to saveAllBarChart without pillow or an Agg based canvas
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return self.saveAllBarChart(filepath, *args, **kwargs)
+
+        canvas = self.fig.canvas
+        if not isinstance(canvas, FigureCanvasAgg):
+            return self.saveAllBarChart(filepath, *args, **kwargs)
+
+        self.plotBarChart(*args, **kwargs)
+        canvas.draw()
+
+        renderer = canvas.get_renderer()
+        size = (int(renderer.width), int(renderer.height))
+        image = Image.frombuffer('RGBA', size, canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+        image.save(filepath, 'PNG', compress_level=1)
 
     def _genEmptyResults(self):
         """ Uses allowed keys to generate a empty dict to start counting from
@@ -341,7 +498,7 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
 
         allowedKeys = self._allowedKeys
 
-        keysDict = OrderedDict()  # Note: list comprehension take 0 then 2 then 1 then 3 etc for some reason. we want strict order
+        keysDict = _OrderedDict()  # Note: we want strict order, plain dicts only keep it from python 3.7
         for k in allowedKeys:
             keysDict[k] = 0
 
@@ -354,19 +511,23 @@ class _BaseDataPerClass(_AstroObjectFigs):  # hangover from ETLOS's multiple chi
 class DataPerParameterBin(_BaseDataPerClass):
     """ Generates Data for planets per parameter bin"""
 
-    def __init__(self, results, planetProperty, binLimits, unit=None, size='small'):
+    def __init__(self, results, planetProperty, binLimits, unit=None, size='small', autolayout=True, object_type=None):
         """
-        :param planetProperty: property of planet to bin. IE 'e' for eccentricity, 'star.magV' for magV
+        :param planetProperty: property of planet to bin. IE 'e' for eccentricity, 'star.magV' for magV. Functions
+            must take no arguments ie 'calcDensity()'
         :param binLimits: list of bin limits (lower limit, upper, upper, maximum) (note you can have maximum +)
         :param unit: unit to scale param to (see general plotter)
+        :param autolayout: use tight_layout on the figure, turn off for batch plotting (see _GlobalFigure)
+        :param object_type: class of the objects in results, skips checking the list (see _AstroObjectFigs)
         :return:
         """
 
         self._binlimits = binLimits
         self._planetProperty = planetProperty
+        self._accessor = _resolve_accessor(planetProperty)
 
         self._genKeysBins()  # Generate the bin keys/labels (must do before base class processes results)
-        _BaseDataPerClass.__init__(self, results, unit, size)
+        _BaseDataPerClass.__init__(self, results, unit, size, autolayout, object_type)
 
     def _getSortKey(self, planet):
         """ Takes a planet and turns it into a key to be sorted by
@@ -374,18 +535,71 @@ class DataPerParameterBin(_BaseDataPerClass):
         :return:
         """
 
-        value = eval('planet.'+self._planetProperty)
+        try:
+            value = self._accessor(planet)
+        except ac.HierarchyError:  # ie star.magV on a planet without a star, same as _processResults
+            return 'Uncertain'
 
         # TODO some sort of data validation, either before or using try except
 
-        if self.unit is not None:
+        unit = self._binUnit()
+        if unit is not None:
             try:
-                value = value.rescale(self.unit)
+                value = value.rescale(unit)
             except AttributeError:  # either nan or unitless
                 pass
 
         return _sortValueIntoGroup(self._allowedKeys[:-1], self._binlimits, value)
 
+    def _binUnit(self):
+        """ The unit values are rescaled to before binning, self.unit or if None the default for the parameter (the
+        unit the axis is labelled with) so the bins dont depend on the units of whichever object is first
+        """
+        if self.unit is not None:
+            return self.unit
+
+        try:
+            return self._getParLabelAndUnit(self._planetProperty)[1]
+        except KeyError:  # parameter not in _planetPars / _starPars
+            return None
+
+    def _processResults(self):
+        """ Bins every object at once with np.searchsorted rather than calling _getSortKey per object. The bins follow
+        _sortValueIntoGroup, [lower, upper) with the final bin including the maximum. Objects raising HierarchyError
+        (ie 'star.magV' for a planet without a star) are counted as 'Uncertain'
+        :return:
+        """
+
+        values = np.asarray(self._evaluateParameter(self._accessor, self._binUnit()))  # as magnitudes in the bin unit
+        groupLimits = np.asarray(self._binlimits, dtype=np.float64)
+        numLimits = len(groupLimits)
+
+        # nan sorts above everything in searchsorted so count them separately and only bin the rest
+        nanMask = np.isnan(values)
+        values = values[~nanMask]
+
+        keyIndex = np.searchsorted(groupLimits, values, side='right')
+        keyIndex[values == groupLimits[-1]] = numLimits-1  # maximum goes in the last group
+        keyIndex[values == groupLimits[0]] = 1  # as does the minimum in the first
+
+        belowLimits = keyIndex == 0
+        if belowLimits.any():
+            raise BelowLimitsError('Value {0} below limit {1}'.format(values[belowLimits][0], groupLimits[0]))
+
+        aboveLimits = keyIndex == numLimits
+        if aboveLimits.any():
+            raise AboveLimitsError('Value {0} above limit {1}'.format(values[aboveLimits][0], groupLimits[-1]))
+
+        groupKeys = self._allowedKeys[:-1]
+        counts = np.bincount(keyIndex-1, minlength=len(groupKeys))
+
+        resultsByClass = self._genEmptyResults()
+        for key, count in zip(groupKeys, counts):
+            resultsByClass[key] = int(count)
+        resultsByClass['Uncertain'] = int(nanMask.sum())
+
+        return resultsByClass
+
     def _classVariables(self):
         pass  # Overload as we dont want it to set anything in this class
 
@@ -404,14 +618,8 @@ class DataPerParameterBin(_BaseDataPerClass):
         if binlimits[-1] == float('inf'):
             midbinlimits = midbinlimits[:-1]
 
-        lastbin = midbinlimits[0]
-
-        for binlimit in midbinlimits[1:]:
-            if lastbin == binlimit:
-                allowedKeys.append('{0}'.format(binlimit))
-            else:
-                allowedKeys.append('{0} to {1}'.format(lastbin, binlimit))
-            lastbin = binlimit
+        allowedKeys += ['{0}'.format(upper) if lower == upper else '{0} to {1}'.format(lower, upper)
+                        for lower, upper in zip(midbinlimits[:-1], midbinlimits[1:])]
 
         if binlimits[-1] == float('inf'):
             allowedKeys.append('{0}+'.format(binlimits[-2]))
@@ -425,19 +633,23 @@ class GeneralPlotter(_AstroObjectFigs):
     should be turned into a GUI
     """
 
-    def __init__(self, objectList, xaxis=None, yaxis=None, xunit=None, yunit=None, xaxislog=False, yaxislog=False, size='small'):
+    def __init__(self, objectList, xaxis=None, yaxis=None, xunit=None, yunit=None, xaxislog=False, yaxislog=False, size='small',
+                 autolayout=True, object_type=None):
         """
         :param objectList: list of astro objects to use in plot ie planets, stars etc
         :param xaxis: value to use on the xaxis, should be a variable or function of the objects in objectList. ie 'R'
-            for the radius variable and 'calcDensity()' for the calcDensity function
+            for the radius variable and 'calcDensity()' for the calcDensity function. Functions must take no arguments
         :param yaxis: value to use on the yaxis, should be a variable or function of the objects in objectList. ie 'R'
-            for the radius variable and 'calcDensity()' for the calcDensity function
+            for the radius variable and 'calcDensity()' for the calcDensity function. Functions must take no arguments
+
+        :param autolayout: use tight_layout on the figure, turn off for batch plotting (see _GlobalFigure)
+        :param object_type: class of the objects in objectList, skips checking the list (see _AstroObjectFigs)
 
         :type objectList: list, tuple
         :type xaxis: str
         :type yaxis: str
         """
-        _AstroObjectFigs.__init__(self, objectList, size)
+        _AstroObjectFigs.__init__(self, objectList, size, autolayout, object_type)
 
         # setup vars - to be replaced by themes
         self.set_marker_color()
@@ -469,21 +681,23 @@ class GeneralPlotter(_AstroObjectFigs):
         self.set_marker_size(60)
 
     def plot(self):
-        xaxis = [float(x) for x in self._xaxis]
-        yaxis = [float(y) for y in self._yaxis]
+        # float32 is plenty for plotting and halves the data matplotlib pushes through its transforms
+        xaxis = np.asarray(self._xaxis, dtype=np.float32)
+        yaxis = np.asarray(self._yaxis, dtype=np.float32)
 
         assert(len(xaxis) == len(yaxis))
 
-        plt.scatter(xaxis, yaxis, marker=self.marker, facecolor=self._marker_color, edgecolor=self._edge_color,
-                    s=self._marker_size)
+        self.ax.scatter(xaxis, yaxis, marker=self.marker, facecolor=self._marker_color, edgecolor=self._edge_color,
+                        s=self._marker_size)
 
-        plt.xlabel(self.xlabel)
-        plt.ylabel(self.ylabel)
+        self.ax.set_xlabel(self.xlabel)
+        self.ax.set_ylabel(self.ylabel)
+        self._redraw()
 
     def set_xaxis(self, param, unit=None, label=None):
         """ Sets the value of use on the x axis
         :param param: value to use on the xaxis, should be a variable or function of the objects in objectList. ie 'R'
-        for the radius variable and 'calcDensity()' for the calcDensity function
+        for the radius variable and 'calcDensity()' for the calcDensity function. Functions must take no arguments
 
         :param unit: the unit to scale the values to, None will use the default
         :type unit: quantities unit or None
@@ -505,7 +719,7 @@ class GeneralPlotter(_AstroObjectFigs):
     def set_yaxis(self, param, unit=None, label=None):
         """ Sets the value of use on the yaxis
         :param param: value to use on the yaxis, should be a variable or function of the objects in objectList. ie 'R'
-        for the radius variable and 'calcDensity()' for the calcDensity function
+        for the radius variable and 'calcDensity()' for the calcDensity function. Functions must take no arguments
 
         :param unit: the unit to scale the values to
         :type unit: quantities unit or None
@@ -524,24 +738,9 @@ class GeneralPlotter(_AstroObjectFigs):
             self.ylabel = label
 
     def _set_axis(self, param, unit):
-        """ this should take a variable or a function and turn it into a list by evaluating on each planet
+        """ this should take a variable or a function and turn it into an array by evaluating on each planet
         """
-        axisValues = []
-        for astroObject in self.objectList:
-            try:
-                value = eval('astroObject.{0}'.format(param))
-            except ac.HierarchyError:  # ie trying to call planet.star and one planet is a lone ranger
-                value = np.nan
-
-            if unit is None:  # no unit to rescale (a aq.unitless quanitity would otherwise fail with ValueError)
-                axisValues.append(value)
-            else:
-                try:
-                    axisValues.append(value.rescale(unit))
-                except AttributeError:  # either nan or unitless
-                    axisValues.append(value)
-
-        return axisValues
+        return self._evaluateParameter(_resolve_accessor(param), unit)
 
     def set_marker_color(self, color='#3ea0e4', edgecolor='k'):
         """ set the marker color used in the plot
@@ -643,7 +842,7 @@ class DiscoveryMethodByYear(object):
 
         plot_matrix, year_list, discovery_years = self.generate_data()
 
-        fig = plt.figure()
+        fig = plt.figure(tight_layout=True)
         ax = fig.add_subplot(1, 1, 1)
 
         ind = np.arange(len(year_list))
@@ -690,6 +889,29 @@ class DiscoveryMethodByYear(object):
         return fig
 
 
+_accessorRegex = re.compile(r'^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*(\(\))?\Z')  # ie R, star.magV, calcDensity()
+
+
+def _resolve_accessor(param):
+    """ turns a parameter string into a function that fetches that parameter from an astro object. Saves evaluating the
+    string on every object
+    :param param: a variable or function of the object ie 'R', 'star.magV' or 'calcDensity()'. Dotted paths are allowed
+    but functions must take no arguments
+    :return: function taking an astro object and returning the value
+    :raises ValueError: if param is not a (dotted) variable or a function call without arguments
+    """
+
+    if not _accessorRegex.match(param):
+        raise ValueError("param must be a variable or a function without arguments ie 'R', 'star.magV' or "
+                         "'calcDensity()', got {0!r}".format(param))
+
+    if param.endswith('()'):
+        getMethod = operator.attrgetter(param[:-2])
+        return lambda astroObject: getMethod(astroObject)()
+    else:
+        return operator.attrgetter(param)
+
+
 def _sortValueIntoGroup(groupKeys, groupLimits, value):
     """ returns the Key of the group a value belongs to
     :param groupKeys: a list/tuple of keys ie ['1-3', '3-5', '5-8', '8-10', '10+']
@@ -714,10 +936,9 @@ def _sortValueIntoGroup(groupKeys, groupLimits, value):
     elif value == groupLimits[-1]:  # if value is == minimum skip the comparison
         keyIndex = len(groupLimits)-1
     else:
-        for i, limit in enumerate(groupLimits):
-            if value < limit:
-                keyIndex = i
-                break
+        i = bisect_right(groupLimits, value)  # index of the first limit the value is below
+        if i < len(groupLimits):
+            keyIndex = i
 
     if keyIndex == 0:  # below the minimum
         raise BelowLimitsError('Value {0} below limit {1}'.format(value, groupLimits[0]))
@@ -809,4 +1030,8 @@ _starPars = {
     'calcDensity()': ('Stellar Density', aq.gcm3),
 }
 
+if sys.hexversion >= 0x03030000:  # freeze the dicts with interned keys, python 2 has no MappingProxyType
+    _planetPars = types.MappingProxyType(dict((sys.intern(k), v) for k, v in _planetPars.items()))
+    _starPars = types.MappingProxyType(dict((sys.intern(k), v) for k, v in _starPars.items()))
+
 # TODO Binary and System support for plots
\ No newline at end of file
@@ -1,23 +1,45 @@
 import unittest
 from tempfile import mkdtemp, mkstemp
+import os
 import shutil
 
 from .. import OECDatabase, load_db_from_url  # load from root
 from ..database import LoadDataBaseError
+from ..astroclasses import Planet, Star
 from .patches import TestCase
 
 from .. import astroquantities as aq
 
 
+def _writeXMLCases(dirPath, xmlCases):
+    """ writes each xml string to its own file in dirPath, straight through the descriptor mkstemp opens
+    """
+    for systems in xmlCases:
+        fd = mkstemp('.xml', dir=dirPath)[0]
+        try:
+            os.write(fd, systems.encode('utf-8'))
+        finally:
+            os.close(fd)
+
+
 class TestDataBaseLoading(TestCase):
+    """ The database is only read by these tests so the files and database are created once for the class
+    """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # create temp dir
-        self.tempDir = mkdtemp()
-        self._createFakeXML()
-        self.oecdb = OECDatabase(self.tempDir + '/')
+        cls.tempDir = mkdtemp()
+        cls._createFakeXML()
+        cls.oecdb = OECDatabase(cls.tempDir + '/')
 
-    def _createFakeXML(self):
+    def assertChildren(self, astroObject, expected):
+        """ checks the class and name of each child in order, expected is a list of (class name, name)
+        """
+        self.assertEqual([(type(child).__name__, child.name) for child in astroObject.children], expected)
+
+    @classmethod
+    def _createFakeXML(cls):
 
         xmlCases = [
             "<system><name>System 1</name><star><name>Star 1</name></star></system>",  # System -> star
@@ -48,54 +70,56 @@ class TestDataBaseLoading(TestCase):
 			'<separation unit="AU">330</separation></planet></star></system>',
         ]
 
-        for systems in xmlCases:
-            with open(mkstemp('.xml', dir=self.tempDir)[1], 'w') as f:
-                f.write(systems)
+        _writeXMLCases(cls.tempDir, xmlCases)
 
     def test_correct_system_number(self):
         self.assertEqual(len(self.oecdb.systems), 7)
 
+    def test_object_lists_store_their_type(self):
+        self.assertEqual(self.oecdb.planets._homogeneous_type, Planet)
+        self.assertEqual(self.oecdb.stars._homogeneous_type, Star)
+
     def test_correct_star_only_system(self):  # 1
         system = self.oecdb.systemDict['System 1']
 
-        self.assertEqual(str(system.children), "[Star('Star 1')]")
+        self.assertChildren(system, [('Star', 'Star 1')])
         self.assertEqual(system.children[0].children, [])
 
     def test_correct_star_planet_system(self):  # 2
         system = self.oecdb.systemDict['System 2']
 
-        self.assertEqual(str(system.children), "[Star('Star 2')]")
-        self.assertEqual(str(system.children[0].children), "[Planet('Planet 2 b')]")
+        self.assertChildren(system, [('Star', 'Star 2')])
+        self.assertChildren(system.children[0], [('Planet', 'Planet 2 b')])
 
     def test_correct_star_double_planet_system(self):  # 3
         system = self.oecdb.systemDict['System 3']
 
-        self.assertEqual(str(system.children), "[Star('Star 3')]")
-        self.assertEqual(str(system.children[0].children), "[Planet('Planet 3 b'), Planet('Planet 3 c')]")
+        self.assertChildren(system, [('Star', 'Star 3')])
+        self.assertChildren(system.children[0], [('Planet', 'Planet 3 b'), ('Planet', 'Planet 3 c')])
 
     def test_correct_binary_star_planet_system(self):  # 4
         system = self.oecdb.systemDict['System 4']
 
-        self.assertEqual(str(system.children), "[Binary('Binary 4AB')]")
-        self.assertEqual(str(system.children[0].children), "[Star('Star 4A'), Star('Star 4B')]")
-        self.assertEqual(str(system.children[0].children[0].children), "[Planet('Planet 4A b')]")
+        self.assertChildren(system, [('Binary', 'Binary 4AB')])
+        self.assertChildren(system.children[0], [('Star', 'Star 4A'), ('Star', 'Star 4B')])
+        self.assertChildren(system.children[0].children[0], [('Planet', 'Planet 4A b')])
         self.assertEqual(system.children[0].children[1].children, [])
 
     def test_correct_double_binary_star_planet_system(self):
         system = self.oecdb.systemDict['System 5']
 
-        self.assertEqual(str(system.children), "[Binary('Binary 5AB')]")
-        self.assertEqual(str(system.children[0].children), "[Binary('Binary 5B-AB'), Star('Star 5A')]")
-        self.assertEqual(str(system.children[0].children[0].children), "[Star('Star 5B-A'), Star('Star 5B-B')]")
-        self.assertEqual(str(system.children[0].children[0].children[0].children), "[Planet('Planet 5B-A b')]")
+        self.assertChildren(system, [('Binary', 'Binary 5AB')])
+        self.assertChildren(system.children[0], [('Binary', 'Binary 5B-AB'), ('Star', 'Star 5A')])
+        self.assertChildren(system.children[0].children[0], [('Star', 'Star 5B-A'), ('Star', 'Star 5B-B')])
+        self.assertChildren(system.children[0].children[0].children[0], [('Planet', 'Planet 5B-A b')])
         self.assertEqual(system.children[0].children[1].children, [])
         self.assertEqual(system.children[0].children[0].children[1].children, [])
 
     def test_correct_binary_planet_star_system(self):
         system = self.oecdb.systemDict['System 6']
 
-        self.assertEqual(str(system.children), "[Binary('Binary 6AB')]")
-        self.assertEqual(str(system.children[0].children), "[Star('Star 6A'), Star('Star 6B'), Planet('Planet 6AB b')]")
+        self.assertChildren(system, [('Binary', 'Binary 6AB')])
+        self.assertChildren(system.children[0], [('Star', 'Star 6A'), ('Star', 'Star 6B'), ('Planet', 'Planet 6AB b')])
         self.assertEqual(system.children[0].children[0].children, [])
         self.assertEqual(system.children[0].children[1].children, [])
 
@@ -104,8 +128,9 @@ class TestDataBaseLoading(TestCase):
 
         self.assertEqual(system.children[0].children[0].separation, 330 * aq.au)
 
-    def tearDown(self):
-        shutil.rmtree(self.tempDir)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tempDir)
 
 
 class TestDataBaseFailing(TestCase):
@@ -125,9 +150,7 @@ class TestDataBaseFailing(TestCase):
             "<planet><name>Planet 2 b</name></planet></star>",
         ]
 
-        for systems in xmlCases:
-            with open(mkstemp('.xml', dir=self.tempDir)[1], 'w') as f:
-                f.write(systems)
+        _writeXMLCases(self.tempDir, xmlCases)
 
         with self.assertRaises(LoadDataBaseError):
             OECDatabase(self.tempDir)
@@ -1,13 +1,19 @@
 import unittest
+import os
+import shutil
+from tempfile import mkdtemp
 
 from .patches import TestCase
 
 import numpy as np
+import matplotlib.pyplot as plt
 
 
 from ..example import genExamplePlanet
-from ..plots import DataPerParameterBin, GeneralPlotter, _AstroObjectFigs, _GlobalFigure, _planetPars, _starPars
+from ..plots import DataPerParameterBin, GeneralPlotter, _AstroObjectFigs, _GlobalFigure, _planetPars, _starPars, \
+    _BaseDataPerClass, _resolve_accessor, _sortValueIntoGroup, AboveLimitsError, BelowLimitsError, use_fast_backend
 from .. import astroquantities as aq
+from ..database import HomogeneousList
 
 
 class Test_GlobalFigure(TestCase):
@@ -20,12 +26,136 @@ class Test_GlobalFigure(TestCase):
         fig = _GlobalFigure()
         fig.set_x_axis_log()
 
+    def _countDraws(self):
+        """ replaces draw_idle on the canvas class with a counter for the rest of the test, returns the count list
+        """
+        probe = plt.figure()
+        canvasClass = type(probe.canvas)
+        plt.close(probe)
+
+        draws = []
+        originalDrawIdle = canvasClass.__dict__.get('draw_idle')
+        canvasClass.draw_idle = lambda canvas, *args, **kwargs: draws.append(canvas.figure)
+
+        if originalDrawIdle is None:  # inherited, removing the patch restores it
+            self.addCleanup(delattr, canvasClass, 'draw_idle')
+        else:
+            self.addCleanup(setattr, canvasClass, 'draw_idle', originalDrawIdle)
+        return draws
+
+    def test_setup_draws_once(self):
+        draws = self._countDraws()
+        fig = _GlobalFigure()
+
+        self.assertEqual(draws, [fig.fig])
+
+    def test_batch_redraw_nested_draws_once(self):
+        fig = _GlobalFigure()
+        draws = self._countDraws()
+
+        with fig._batch_redraw():
+            fig.set_title_size(14)
+            with fig._batch_redraw():  # the outer block draws
+                fig.set_axis_label_size(14)
+            self.assertEqual(draws, [])
+
+        self.assertEqual(draws, [fig.fig])
+
+    def test_redraw_targets_own_figure(self):
+        fig = _GlobalFigure()
+        plt.figure()  # no longer the current pyplot figure
+        draws = self._countDraws()
+
+        fig.set_title_size(14)
+
+        self.assertEqual(draws, [fig.fig])
+
+    def test_autolayout(self):
+        self.assertTrue(_GlobalFigure().fig.get_tight_layout())
+        self.assertFalse(_GlobalFigure(autolayout=False).fig.get_tight_layout())
+
+    def test_set_axis_tick_label_size(self):
+        fig = _GlobalFigure()
+        fig.set_axis_tick_label_size(14)
+        fig.set_axis_tick_label_size(14)  # unchanged so skipped
+
+        for label in fig.ax.get_xticklabels() + fig.ax.get_yticklabels():
+            self.assertEqual(label.get_fontsize(), 14)
+
+    def test_set_foregroundcolor(self):
+        fig = _GlobalFigure()
+        fig.set_foregroundcolor('r')
+        fig.set_foregroundcolor('r')  # unchanged so skipped
+
+        self.assertEqual(fig.ax.title.get_color(), 'r')
+        for label in fig.ax.get_xticklabels() + fig.ax.get_yticklabels():
+            self.assertEqual(label.get_color(), 'r')
+
+    def test_set_axis_tick_label_size_after_axes_change(self):
+        fig = _GlobalFigure()
+        fig.ax.tick_params(labelsize=8)
+        fig.set_axis_tick_label_size(12)
+
+        for label in fig.ax.get_xticklabels() + fig.ax.get_yticklabels():
+            self.assertEqual(label.get_fontsize(), 12)
+
+        fig.ax.cla()  # resets the ticks to the rcParams size
+        fig.set_global_font_size(12)
+
+        for label in fig.ax.get_xticklabels() + fig.ax.get_yticklabels():
+            self.assertEqual(label.get_fontsize(), 12)
+
+    def test_set_foregroundcolor_after_axes_change(self):
+        fig = _GlobalFigure()
+        fig.set_foregroundcolor('r')
+        fig.ax.cla()  # resets the colours
+        fig.set_foregroundcolor('r')
+
+        self.assertEqual(fig.ax.title.get_color(), 'r')
+        for label in fig.ax.get_xticklabels() + fig.ax.get_yticklabels():
+            self.assertEqual(label.get_color(), 'r')
+
 
 class Test_AstroObjectFigs(TestCase):
 
-    @unittest.skip("Tested through others but should probably be done here aswell")
     def test_getInputObjectTypes(self):
-        assert False
+        planetlist = generate_list_of_planets(3)
+        starlist = [planet.star for planet in planetlist]
+
+        self.assertEqual(_AstroObjectFigs(planetlist)._objectType, type(planetlist[0]))
+        self.assertEqual(_AstroObjectFigs(starlist)._objectType, type(starlist[0]))
+
+        with self.assertRaises(TypeError):
+            _AstroObjectFigs(planetlist + starlist)
+
+    def test_given_object_type_skips_check(self):
+        planetlist = generate_list_of_planets(3)
+        planetType = type(planetlist[0])
+
+        self.assertEqual(_AstroObjectFigs(planetlist, object_type=planetType)._objectType, planetType)
+        self.assertEqual(_AstroObjectFigs(HomogeneousList(planetType, planetlist))._objectType, planetType)
+
+    def test_homogeneous_list_rejects_mixed_types(self):
+        planetlist = generate_list_of_planets(3)
+        starlist = [planet.star for planet in planetlist]
+        objectList = HomogeneousList(type(planetlist[0]), planetlist)
+
+        for mutate in (lambda: objectList.append(starlist[0]), lambda: objectList.insert(0, starlist[0]),
+                       lambda: objectList.extend(starlist), lambda: objectList.__iadd__(starlist),
+                       lambda: objectList.__setitem__(0, starlist[0]),
+                       lambda: objectList.__setitem__(slice(0, 1), starlist[:1])):
+            with self.assertRaises(TypeError):
+                mutate()
+
+        with self.assertRaises(TypeError):
+            objectList += starlist
+            GeneralPlotter(objectList, 'R', 'M')  # would plot the stellar radii as planet radii
+
+        with self.assertRaises(TypeError):
+            HomogeneousList(type(planetlist[0]), planetlist + starlist)
+
+        self.assertEqual(objectList, planetlist)  # unchanged by the rejected mutations
+        self.assertEqual(_AstroObjectFigs(objectList)._objectType, type(planetlist[0]))
 
     @unittest.skip("Tested through others but should probably be done here aswell")
     def test_getParLabelAndUnit(self):
@@ -48,6 +178,29 @@ class Test_AstroObjectFigs(TestCase):
             fig._get_unit_symbol(None)
 
 
+class _DataPerRadiusClass(_BaseDataPerClass):
+
+    def _classVariables(self):
+        self._allowedKeys = ('Small', 'Large', 'Uncertain')
+
+    def _getSortKey(self, planet):
+        if np.isnan(planet.R):
+            return 'Uncertain'
+        return 'Large' if planet.R > 1 * aq.R_j else 'Small'
+
+
+class Test_BaseDataPerClass(TestCase):
+
+    def test_processResults(self):
+        planets = generate_list_of_planets(5)
+        for planet, radius in zip(planets, (0.5*aq.R_j, 2*aq.R_j, 3*aq.R_j, 0.1*aq.R_j, np.nan)):
+            planet.params['radius'] = radius
+
+        data = _DataPerRadiusClass(planets)
+        self.assertDictEqual({'Small': 2, 'Large': 2, 'Uncertain': 1}, data._processResults())
+        self.assertEqual(list(data.resultsByClass), ['Small', 'Large', 'Uncertain'])
+
+
 class Test_DataPerParameterBin(TestCase):
 
     def testDataGeneratesCorrectly(self):
@@ -105,6 +258,74 @@ class Test_DataPerParameterBin(TestCase):
 
         self.assertDictEqual(answer, data._processResults())
 
+    def test_genKeysBins(self):
+        planets = generate_list_of_planets(1)
+
+        data = DataPerParameterBin(planets, 'e', (-float('inf'), 0, 0, 0.5, 1, float('inf')))
+        self.assertEqual(data._allowedKeys, ['<0', '0', '0 to 0.5', '0.5 to 1', '1+', 'Uncertain'])
+
+    def test_processResults_matches_getSortKey(self):
+        planets = []
+        planetInfoList = (0, 0.1, 0.2, 0.2, 0.3, 0.4, 0.45, 0.6, np.nan, np.nan)
+
+        for planetInfo in planetInfoList:
+            planet = genExamplePlanet()
+            planet.params['eccentricity'] = planetInfo
+            planets.append(planet)
+
+        data = DataPerParameterBin(planets, 'e', (0, 0.2, 0.4, 0.6))
+        answer = dict((key, 0) for key in data._allowedKeys)
+        for planet in planets:
+            answer[data._getSortKey(planet)] += 1
+
+        self.assertDictEqual(answer, data._processResults())
+
+    def test_mixed_units_binned_in_default_unit(self):
+        planets = generate_list_of_planets(4)
+        radiusValues = (0.5*aq.R_j, 22*aq.R_e, 7*aq.R_j, 5.6*aq.R_e)  # 22 R_e is ~2 R_j and 5.6 R_e ~0.5 R_j
+
+        for planet, radius in zip(planets, radiusValues):
+            planet.params['radius'] = radius
+
+        answer = {'0 to 1': 2, '1 to 5': 1, '5 to 10': 1, 'Uncertain': 0}
+
+        for planetlist in (planets, planets[::-1]):  # should not depend on the units of the first planet
+            data = DataPerParameterBin(planetlist, 'R', (0, 1, 5, 10))
+            self.assertDictEqual(answer, data._processResults())
+
+    def test_planet_without_star_is_uncertain(self):
+        planets = generate_list_of_planets(3)
+        for planet, magV in zip(planets, (1, 6, 8)):
+            planet.star.params['magV'] = magV
+        planets[1].parent = False  # lone planet, planet.star raises HierarchyError
+
+        data = DataPerParameterBin(planets, 'star.magV', (0, 5, 10))
+        answer = {'0 to 5': 1, '5 to 10': 1, 'Uncertain': 1}
+
+        self.assertDictEqual(answer, data._processResults())
+        self.assertEqual(data._getSortKey(planets[1]), 'Uncertain')
+
+    def test_all_nan_values_are_uncertain(self):
+        planets = generate_list_of_planets(3)
+        for planet in planets:
+            planet.params['eccentricity'] = np.nan
+
+        data = DataPerParameterBin(planets, 'e', (0, 0.2, 0.4, 0.6))
+        answer = {'0 to 0.2': 0, '0.2 to 0.4': 0, '0.4 to 0.6': 0, 'Uncertain': 3}
+
+        self.assertDictEqual(answer, data._processResults())
+
+    def test_value_above_limits_raises_AboveLimitsError(self):
+        planets = []
+
+        for planetInfo in (0.1, 0.9):
+            planet = genExamplePlanet()
+            planet.params['eccentricity'] = planetInfo
+            planets.append(planet)
+
+        with self.assertRaises(AboveLimitsError):
+            DataPerParameterBin(planets, 'e', (0, 0.2, 0.4, 0.6))
+
     def test_plotbarchart_for_all_planet_params_generate_without_exception(self):
         planetlist = generate_list_of_planets(3)
 
@@ -125,6 +346,42 @@ class Test_DataPerParameterBin(TestCase):
         with self.assertRaises(TypeError):
             fig = DataPerParameterBin(starlist + planetlist, 'R', (-float('inf'), 0, 5, float('inf'))).plotBarChart()
 
+    def test_saveAllBarChart_writes_file(self):
+        planetlist = generate_list_of_planets(3)
+        tempDir = mkdtemp()
+
+        try:
+            filepath = os.path.join(tempDir, 'bar.png')
+            DataPerParameterBin(planetlist, 'R', (-float('inf'), 0, 5, float('inf'))).saveAllBarChart(filepath)
+            self.assertTrue(os.path.isfile(filepath))
+        finally:
+            shutil.rmtree(tempDir)
+
+    def test_saveAllBarChartFast_matches_saveAllBarChart(self):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise unittest.SkipTest('pillow is needed to read the images')
+
+        planetlist = generate_list_of_planets(3)
+        tempDir = mkdtemp()
+
+        try:
+            fastpath = os.path.join(tempDir, 'fast.png')
+            data = DataPerParameterBin(planetlist, 'R', (-float('inf'), 0, 5, float('inf')))
+            data.saveAllBarChartFast(fastpath)
+
+            slowpath = os.path.join(tempDir, 'slow.png')
+            DataPerParameterBin(planetlist, 'R', (-float('inf'), 0, 5, float('inf'))).saveAllBarChart(slowpath)
+
+            fastImage = Image.open(fastpath)
+            slowImage = Image.open(slowpath)
+            self.assertEqual(fastImage.size, data.fig.canvas.get_width_height())
+            self.assertEqual(fastImage.size, slowImage.size)
+            self.assertEqual(fastImage.convert('RGBA').tobytes(), slowImage.convert('RGBA').tobytes())
+        finally:
+            shutil.rmtree(tempDir)
+
     def test_plotpiechart_for_all_planet_params_generate_without_exception(self):
         planetlist = generate_list_of_planets(3)
 
@@ -151,6 +408,15 @@ class Test_GeneralPlotter(TestCase):
     def test__init__(self):
         x = GeneralPlotter(generate_list_of_planets(3))
 
+    def test_plot_labels_own_axes(self):
+        fig = GeneralPlotter(generate_list_of_planets(3), 'R', 'M')
+        plt.figure()  # no longer the current pyplot figure
+        fig.plot()
+
+        self.assertEqual(fig.ax.get_xlabel(), fig.xlabel)
+        self.assertEqual(fig.ax.get_ylabel(), fig.ylabel)
+        self.assertEqual(plt.gca().get_xlabel(), '')
+
     def test_set_axis_with_variables(self):
         planetlist = generate_list_of_planets(3)
         radiusValues = (5*aq.R_j, 10*aq.R_j, 15*aq.R_j)
@@ -225,6 +491,20 @@ class Test_GeneralPlotter(TestCase):
         # for some reason the items equal assert fails, comparing the str representations is equivilent with strict order
         self.assertItemsEqual(fig._set_axis('magV', None), magVValues)
 
+    def test_set_axis_with_nan_and_unit_scaling(self):
+        planetlist = generate_list_of_planets(3)
+        radiusValues = (5*aq.R_j, np.nan, 15*aq.R_j)
+
+        for i, radius in enumerate(radiusValues):
+            planetlist[i].params['radius'] = radius
+
+        fig = GeneralPlotter(planetlist)
+        results = fig._set_axis('R', aq.m)
+
+        self.assertAlmostEqual(results[0], radiusValues[0].rescale(aq.m), 4)
+        self.assertTrue(np.isnan(results[1]))
+        self.assertAlmostEqual(results[2], radiusValues[2].rescale(aq.m), 4)
+
     def test_plotting_on_all_planet_params_generate_without_exception(self):
         planetlist = generate_list_of_planets(3)
 
@@ -273,4 +553,68 @@ class Test_GeneralPlotter(TestCase):
         fig = GeneralPlotter(planetlist)
 
         self.assertItemsAlmostEqual(fig._set_axis('calcSurfaceGravity()', aq.km / aq.hr**2),
-                                    (52417.5200676341 * aq.km/aq.h**2, 13104.380016908524 * aq.km/aq.h**2, 5824.1688964037885 * aq.km/aq.h**2), 4)
\ No newline at end of file
+                                    (52417.5200676341 * aq.km/aq.h**2, 13104.380016908524 * aq.km/aq.h**2, 5824.1688964037885 * aq.km/aq.h**2), 4)
+
+
+class Test_resolve_accessor(TestCase):
+
+    def test_variable(self):
+        planet = genExamplePlanet()
+        self.assertEqual(_resolve_accessor('R')(planet), planet.R)
+
+    def test_parent_variable(self):
+        planet = genExamplePlanet()
+        self.assertEqual(_resolve_accessor('star.magV')(planet), planet.star.magV)
+
+    def test_function(self):
+        planet = genExamplePlanet()
+        self.assertAlmostEqual(_resolve_accessor('calcDensity()')(planet), planet.calcDensity(), 6)
+
+    def test_function_with_arguments_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            _resolve_accessor('calcTemperature(0.3)')
+
+    def test_expression_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            _resolve_accessor('R * 2')
+
+    def test_trailing_newline_raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            _resolve_accessor('R\n')
+
+
+class Test_use_fast_backend(TestCase):
+
+    def setUp(self):
+        self.backend = plt.get_backend()
+
+    def tearDown(self):  # switching closes all figures, so only switch back if the backend changed
+        if plt.get_backend() != self.backend:
+            plt.switch_backend(self.backend)
+
+    def test_switches_to_agg(self):
+        use_fast_backend()
+        self.assertEqual(plt.get_backend().lower(), 'agg')
+
+
+class Test_sortValueIntoGroup(TestCase):
+
+    def setUp(self):
+        self.groupKeys = ['0 to 5', '5 to 15', '15 to 30']
+        self.groupLimits = [0, 5, 15, 30]
+
+    def test_values_sorted_into_groups(self):
+        values = (0, 1, 5, 14.9, 15, 29, 30)
+        answer = ['0 to 5', '0 to 5', '5 to 15', '5 to 15', '15 to 30', '15 to 30', '15 to 30']
+
+        self.assertEqual([_sortValueIntoGroup(self.groupKeys, self.groupLimits, value) for value in values], answer)
+
+    def test_nan_is_uncertain(self):
+        self.assertEqual(_sortValueIntoGroup(self.groupKeys, self.groupLimits, np.nan), 'Uncertain')
+
+    def test_outside_limits_raises_errors(self):
+        with self.assertRaises(BelowLimitsError):
+            _sortValueIntoGroup(self.groupKeys, self.groupLimits, -1)
+
+        with self.assertRaises(AboveLimitsError):
+            _sortValueIntoGroup(self.groupKeys, self.groupLimits, 31)